@@ -68,6 +68,15 @@ class CodeCompareCLI:
             "--export-json", type=str, default=None, metavar='FILE',
             help="Export detailed results and statistics to a JSON file."
         )
+        parser.add_argument(
+            "--no-log", action="store_true",
+            help="Do not write the verbose JSON log to the 'outputs' folder."
+        )
+        parser.add_argument(
+            "--jit", choices=["none", "numba"], default="none",
+            help="Compile snippets with numba before timing (default: none).\n"
+                 "Snippets numba cannot compile are timed interpreted."
+        )
 
         args = parser.parse_args()
 
@@ -98,7 +107,15 @@ class CodeCompareCLI:
                 setup_code=custom_setup_code
             )
 
+            last_percent = -1
+
             def progress_callback(rep, elapsed):
+                # Only redraw when the whole percentage changes: at most 101 terminal writes per run.
+                nonlocal last_percent
+                percent = (rep + 1) * 100 // args.reps
+                if percent == last_percent:
+                    return
+                last_percent = percent
                 Colors.progress_bar(rep + 1, args.reps, prefix="Progress:", suffix=f"{rep + 1}/{args.reps}")
 
             results = comparer.compare_execution(
@@ -106,12 +123,15 @@ class CodeCompareCLI:
                 num_executions_per_rep=args.num,
                 warmup_runs=args.warmup,
                 on_repeat_end=progress_callback,
-                export_json=args.export_json
+                export_json=args.export_json,
+                write_log=not args.no_log,
+                jit=args.jit
             )
 
             if results:
                 rel_perf = results['relative_performance']
-                print(Colors.bold(f"\nRelative Performance: {rel_perf['times']}x ({rel_perf['percentage']}%)"))
+                mixed = " (mixed JIT modes)" if rel_perf['mixed_jit'] else ""
+                print(Colors.bold(f"\nRelative Performance: {rel_perf['times']}x ({rel_perf['percentage']}%){mixed}"))
 
         except Exception as e:
             print(Colors.red(Colors.bold("\n--- UNEXPECTED ERROR ---")))
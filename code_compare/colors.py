@@ -32,10 +32,13 @@ class Colors:
     REVERSE = '\033[7m'
     ENDC = '\033[0m'
     enabled = True
+    # Rendered progress bars per bar length, indexed by filled length.
+    _bars = {}
 
     @staticmethod
     def disable():
         Colors.enabled = False
+        Colors._bars = {}
         for attr in dir(Colors):
             val = getattr(Colors, attr)
             if isinstance(val, str) and val.startswith('\033'):
@@ -43,7 +46,7 @@ class Colors:
 
     @staticmethod
     def _colorize(code, text):
-        return f"{code}{text}{Colors.ENDC}" if Colors.enabled else text
+        return code + text + Colors.ENDC if Colors.enabled else text
 
     red = staticmethod(lambda t: Colors._colorize(Colors.RED, t))
     green = staticmethod(lambda t: Colors._colorize(Colors.BRIGHT_GREEN, t))
@@ -61,9 +64,14 @@ class Colors:
     @staticmethod
     def progress_bar(current, total, bar_length=32, prefix='', suffix=''):
         percent = float(current) / total if total else 0
-        filled_length = int(bar_length * percent)
-        bar = Colors.green('█' * filled_length) + Colors.gray('░' * (bar_length - filled_length))
+        filled_length = min(int(bar_length * percent), bar_length)
+        bars = Colors._bars.get(bar_length)
+        if bars is None:
+            bars = Colors._bars[bar_length] = [
+                Colors.green('█' * i) + Colors.gray('░' * (bar_length - i))
+                for i in range(bar_length + 1)
+            ]
         percent_str = Colors.cyan(f"{percent*100:6.2f}%")
-        print(f"\r{prefix}[{bar}] {percent_str} {suffix}", end='', flush=True)
+        print(f"\r{prefix}[{bars[filled_length]}] {percent_str} {suffix}", end='', flush=True)
         if current == total:
             print()
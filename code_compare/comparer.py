@@ -1,12 +1,16 @@
 import os
 import sys
+import ast
 import math
+import mmap
 import json
 import time
 import random
-import statistics
+import itertools
 import platform
 import datetime
+from array import array
+from bisect import bisect_right
 from typing import List, Tuple, Callable, Optional
 
 try:
@@ -14,21 +18,113 @@ try:
 except ImportError:
     psutil = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from .colors import Colors
 from .utils import suppress_output, gc_disabled
 
+# Setup and snippet are inlined into a generated function (as timeit does), so one
+# call runs the setup untimed and then every execution of a repetition, with no
+# exec() inside the timed loop. Setup names are locals of the function, so the
+# snippet can rebind them. The parsed setup and snippet statements replace the
+# _setup and _stmt placeholders, which keeps string literals byte-exact and line
+# numbers those of the original sources. Callers pass itertools.repeat(None, n) as
+# _it rather than range(n): its C-level next() returns None without creating an
+# int per step.
+_TIMING_TEMPLATE = """
+def inner(_it, _timer{init}):
+    _setup
+    _t0 = _timer()
+    for _i in _it:
+        _stmt
+        pass
+    return _timer() - _t0
+"""
+
+# With --jit numba, the snippet's statements replace _body in this function, which
+# is compiled with numba.njit and called from the timing loop. It returns a scalar
+# built from the names the snippet assigns, so LLVM cannot eliminate the snippet's
+# work as dead code and no container is boxed back into a Python object per call.
+_JIT_TEMPLATE = """
+def _jit_snippet():
+    _body
+    return {sink}
+"""
+
+# Scopes whose assignments do not bind names of the enclosing snippet.
+_NESTED_SCOPES = (
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+)
+
+
+def _assigned_names(stmts: list) -> List[str]:
+    """
+    Return the names the statements assign, in order, outside nested scopes.
+
+    Args:
+        stmts (list): ast statements of a snippet.
+
+    Returns:
+        List[str]: Assigned names, without duplicates.
+    """
+    names = {}
+
+    def visit(node):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names[node.id] = None
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, _NESTED_SCOPES):
+                visit(child)
+
+    visit(ast.Module(stmts, []))
+    return list(names)
+
+
+def _seed_numba_random(seed):
+    # Jitted code draws from numba's own generator, which random.seed() in the
+    # interpreter never reaches; compiled with numba.njit, this seeds it.
+    random.seed(seed)
+
+# Two-sided 95% Student's t critical values as (sample size n, t for n - 1 degrees
+# of freedom). Sizes between entries use the entry below, which is conservative.
+_T95 = (
+    (2, 12.71), (3, 4.30), (4, 3.18), (5, 2.78), (6, 2.57), (7, 2.45), (8, 2.36),
+    (9, 2.31), (10, 2.26), (11, 2.23), (12, 2.20), (13, 2.18), (14, 2.16), (15, 2.14),
+    (16, 2.13), (17, 2.12), (18, 2.11), (19, 2.10), (20, 2.09), (21, 2.09), (22, 2.08),
+    (23, 2.07), (24, 2.07), (25, 2.06), (26, 2.06), (27, 2.06), (28, 2.05), (29, 2.05),
+    (30, 2.05), (31, 2.04), (41, 2.02), (61, 2.00), (121, 1.98), (1001, 1.96),
+)
+
 class CodeComparer:
     """
     CodeComparer provides functionality to compare the execution speed of two Python code snippets.
     It supports deterministic benchmarking, statistical analysis, and exporting results.
     """
 
+    # Files larger than this are read through mmap instead of a buffered read.
+    MMAP_THRESHOLD = 64 * 1024
+    # File contents keyed by (absolute path, mtime, size), shared by all instances.
+    _file_cache = {}
+
+    # Prepended to every setup; the random module itself is seeded by the timing
+    # loop right before the setup runs.
+    SETUP_PREFIX = "import random\n"
     DEFAULT_SETUP_CODE = """
 import time
 import random
+_r = random.Random(random.getrandbits(64))
 """
     DEFAULT_CODE_1 = """
-sleep_duration = random.random() * 0.005
+sleep_duration = _r.random() * 0.005
 time.sleep(sleep_duration)
 """
     DEFAULT_CODE_2 = """
@@ -49,10 +145,15 @@ for i in range(iterations):
         """
         print(Colors.blue(Colors.bold("Initializing CodeComparer...")))
         self.fixed_seed = 42
-        self.setup_code = (
-            f"import random\nrandom.seed({self.fixed_seed})\n"
-            + (setup_code if setup_code is not None else self.DEFAULT_SETUP_CODE)
-        )
+        self._setup_source = setup_code if setup_code is not None else self.DEFAULT_SETUP_CODE
+        try:
+            self._setup_code_obj = compile(ast.Module(self._setup_statements(), []), '<setup>', 'exec')
+        except SyntaxError as e:
+            print(Colors.red(f"Error compiling setup code: {e}"))
+            print(Colors.yellow("Falling back to default setup code."))
+            self._setup_source = self.DEFAULT_SETUP_CODE
+            self._setup_code_obj = compile(ast.Module(self._setup_statements(), []), '<setup>', 'exec')
+        self.setup_code = self.SETUP_PREFIX + self._setup_source
         setup_display = self.setup_code.strip().split('\n')[0] + ('...' if '\n' in self.setup_code.strip() else '')
         print(f"Using Setup Code (starts with): {Colors.cyan(setup_display)}")
 
@@ -66,15 +167,25 @@ for i in range(iterations):
         )
         print(f"Source for Code 2: {Colors.magenta(self.source_2)}")
 
-        self.measurements_1: List[float] = []
-        self.measurements_2: List[float] = []
+        self.measurements_1: array = array('d')
+        self.measurements_2: array = array('d')
         self.stats_1 = {}
         self.stats_2 = {}
+        self.jitted_1 = False
+        self.jitted_2 = False
+        self._env = self._env_info()
+        self._numba_seed = None
+        if psutil:
+            # Prime the counters so the next non-blocking call reports load since now.
+            psutil.cpu_percent(interval=None)
 
     def _read_file_content(self, file_path: str) -> Optional[str]:
         """
         Read and return the content of a file.
 
+        Contents are cached by path, modification time and size, so reloading an
+        unchanged file skips the read. Large files are mapped with mmap.
+
         Args:
             file_path (str): Path to the file.
 
@@ -85,9 +196,21 @@ for i in range(iterations):
             if not os.path.isfile(file_path):
                 print(Colors.red(f"Error: File not found at '{file_path}'."))
                 return None
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except (OSError, UnicodeDecodeError) as e:
+            st = os.stat(file_path)
+            key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+            content = CodeComparer._file_cache.get(key)
+            if content is None:
+                with open(file_path, 'rb') as f:
+                    if st.st_size > self.MMAP_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            data = mm[:]
+                    else:
+                        data = f.read()
+                # Match text-mode reading: universal newlines.
+                content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                CodeComparer._file_cache[key] = content
+            return content
+        except (OSError, ValueError) as e:
             print(Colors.red(f"Error reading file '{file_path}': {e}"))
             return None
 
@@ -124,19 +247,239 @@ for i in range(iterations):
             os.makedirs(outputs_dir)
         return outputs_dir
 
-    def _warmup(self, code: str, setup_code: str, runs: int = 5):
+    def _jit_function(self, snippet_name: str, code: str, sink: str, ns: dict) -> Callable:
+        """
+        Splice a snippet into _JIT_TEMPLATE and return the resulting Python function.
+
+        Args:
+            snippet_name (str): Name used as the code object's filename.
+            code (str): Snippet code forming the function body.
+            sink (str): Expression the function returns.
+            ns (dict): Globals of the function.
+
+        Returns:
+            callable: The uncompiled _jit_snippet function.
+        """
+        tree = ast.parse(_JIT_TEMPLATE.format(sink=sink))
+        tree.body[0].body[0:1] = ast.parse(code, f'<{snippet_name}>').body
+        local_ns = {}
+        exec(compile(tree, f'<{snippet_name}>', 'exec'), ns, local_ns)
+        return local_ns['_jit_snippet']
+
+    def _jit_return_types(self, snippet_name: str, code: str, names: List[str], ns: dict) -> list:
+        """
+        Compile a snippet returning its assigned names, to learn their numba types.
+
+        If returning all of them fails (e.g. a name bound on only one branch), the
+        snippet is compiled on its own and then each name is tried separately.
+
+        Args:
+            snippet_name (str): Name used as the code object's filename.
+            code (str): Snippet code forming the function body.
+            names (List[str]): Names the snippet assigns.
+            ns (dict): Globals of the function.
+
+        Returns:
+            list: (name, numba type) pairs for the names numba can return.
+        """
+        def probe(probe_names):
+            returned = "".join(f"{name}, " for name in probe_names)
+            func = numba.njit(self._jit_function(snippet_name, code, f"({returned})", ns))
+            with suppress_output():
+                func()
+            return func.nopython_signatures[0].return_type.types
+
+        if not names:
+            return []
+        try:
+            return list(zip(names, probe(names)))
+        except Exception:
+            # Raises if the snippet itself cannot be compiled.
+            probe([])
+        found = []
+        for name in names:
+            try:
+                found.append((name, probe([name])[0]))
+            except Exception:
+                pass
+        return found
+
+    def _jit_sink(self, name: str, nb_type) -> Optional[str]:
+        """
+        Return a cheap scalar expression that depends on an assigned name.
+
+        Args:
+            name (str): Name assigned by the snippet.
+            nb_type: numba type inferred for the name.
+
+        Returns:
+            str|None: Expression to add to the sink, or None to leave the name out.
+        """
+        types = numba.types
+        if isinstance(nb_type, (types.Number, types.Boolean)):
+            return name
+        if isinstance(nb_type, types.Array):
+            return f"{name}.size"
+        if isinstance(nb_type, (types.List, types.ListType, types.Set, types.DictType,
+                                types.UnicodeType, types.BaseTuple)):
+            return f"len({name})"
+        return None
+
+    def _jit_compile(self, snippet_name: str, code: str) -> Optional[Callable]:
+        """
+        Compile a snippet with numba.njit, outside of any timed region.
+
+        numba resolves globals at compile time, so the setup runs once into the
+        compiled function's globals instead of being inlined. A first compilation
+        returns the assigned names to learn their types; the compiled function
+        then returns only a scalar sink derived from them.
+
+        Args:
+            snippet_name (str): Name used for reporting and as the code object's filename.
+            code (str): Snippet code to compile.
+
+        Returns:
+            callable|None: The compiled snippet, or None if numba cannot compile it.
+        """
+        ns = self._make_ns()
+        self._seed_random(self.fixed_seed)
+        exec(self._setup_code_obj, ns)
+        names = _assigned_names(ast.parse(code).body)
+        try:
+            terms = [self._jit_sink(name, nb_type)
+                     for name, nb_type in self._jit_return_types(snippet_name, code, names, ns)]
+            sink = " + ".join(term for term in terms if term) or "0"
+            jitted = numba.njit(self._jit_function(snippet_name, code, sink, ns))
+            # The first call triggers compilation; keep it out of warmup and timing.
+            with suppress_output():
+                jitted()
+        except Exception as e:
+            print(Colors.yellow(f"{snippet_name} cannot be compiled with numba ({type(e).__name__}); timing it interpreted."))
+            return None
+        if self._numba_seed is None:
+            self._numba_seed = numba.njit(_seed_numba_random)
+        print(f"{Colors.cyan(snippet_name)} compiled with {Colors.magenta('numba')}.")
+        return jitted
+
+    def _setup_statements(self) -> list:
+        """
+        Parse SETUP_PREFIX and the setup into a fresh list of statements.
+
+        The setup keeps its own line numbers, so errors point into the setup as written.
+
+        Returns:
+            list: ast statements of the prefix followed by the setup.
+        """
+        return ast.parse(self.SETUP_PREFIX).body + ast.parse(self._setup_source, '<setup>').body
+
+    def _compile_timing_function(self, snippet_name: str, init: str, stmts: list, ns: dict):
+        """
+        Splice the setup and the snippet's statements into _TIMING_TEMPLATE and compile it.
+
+        'from m import *' is only allowed at module level, so such setup imports run
+        once into ns, the generated function's globals, instead of being inlined.
+
+        Args:
+            snippet_name (str): Name used as the code object's filename.
+            init (str): Extra parameters for the generated function's signature.
+            stmts (list): ast statements to inline into the timing loop.
+            ns (dict): Globals the generated function will be executed in.
+
+        Returns:
+            code: Compiled module defining inner().
+        """
+        setup, star_imports = [], []
+        for node in self._setup_statements():
+            is_star = isinstance(node, ast.ImportFrom) and node.names[0].name == '*'
+            (star_imports if is_star else setup).append(node)
+        if star_imports:
+            exec(compile(ast.Module(star_imports, []), '<setup>', 'exec'), ns)
+        tree = ast.parse(_TIMING_TEMPLATE.format(init=init))
+        func = tree.body[0]
+        loop = next(node for node in func.body if isinstance(node, ast.For))
+        loop.body[0:1] = stmts
+        func.body[0:1] = setup
+        return compile(tree, f'<{snippet_name}>', 'exec')
+
+    def _make_inner(self, snippet_name: str, code: str, jit: str = "none") -> Callable:
+        """
+        Build the timing function for a snippet from _TIMING_TEMPLATE.
+
+        Args:
+            snippet_name (str): Name used as the code object's filename.
+            code (str): Snippet code to inline into the timing loop.
+            jit (str): "numba" to time a numba-compiled snippet when possible, else "none".
+
+        Returns:
+            (callable, bool): inner(iterator, timer) that runs the setup, then returns
+                the elapsed timer ticks of the timed loop; and whether the snippet was jitted.
+        """
+        # Compile the snippet on its own first so module-level errors (and statements
+        # such as 'return' that would be valid inside inner) are reported as-is.
+        compile(code, f'<{snippet_name}>', 'exec')
+        init, stmt = "", code
+        ns, local_ns = self._make_ns(), {}
+        jitted = None
+        if jit == "numba":
+            jitted = self._jit_compile(snippet_name, code)
+            if jitted is not None:
+                # Bind the compiled function as a default argument so the loop reads a fast local.
+                local_ns['_jit_snippet'] = jitted
+                # Keep the scalar result so the call's work stays observable.
+                init, stmt = ", _jit_snippet=_jit_snippet", "_sink = _jit_snippet()"
+        stmts = ast.parse(stmt, f'<{snippet_name}>').body
+        exec(self._compile_timing_function(snippet_name, init, stmts, ns), ns, local_ns)
+        return local_ns['inner'], jitted is not None
+
+    def _warmup(self, inner: Callable, runs: int = 5):
         """
         Run warmup executions to stabilize timing.
 
         Args:
-            code (str): Code to execute.
-            setup_code (str): Setup code to run before.
+            inner (callable): Timing function wrapping the setup and the code to execute.
             runs (int): Number of warmup runs.
         """
-        for _ in range(runs):
-            with suppress_output():
-                exec(setup_code, {}, {})
-                exec(code, {}, {})
+        with suppress_output():
+            for _ in range(runs):
+                self._seed_random(self.fixed_seed)
+                inner(itertools.repeat(None, 1), time.perf_counter_ns)
+
+    def _mean_stdev(self, data: List[float]) -> Tuple[float, float]:
+        """
+        Compute the mean and sample standard deviation of a list of timings.
+
+        Args:
+            data (List[float]): List of timing measurements.
+
+        Returns:
+            (float, float): Mean and sample standard deviation.
+        """
+        n = len(data)
+        mean = math.fsum(data) / n
+        if n < 2:
+            return mean, 0.0
+        variance = math.fsum([(x - mean) ** 2 for x in data]) / (n - 1)
+        return mean, math.sqrt(variance)
+
+    def _percentile(self, sorted_data: List[float], p: int) -> float:
+        """
+        Compute the p-th percentile of already sorted timings.
+
+        Interpolates like statistics.quantiles(data, n=100)[p - 1] without
+        building the other 98 cut points.
+
+        Args:
+            sorted_data (List[float]): Timing measurements in ascending order.
+            p (int): Percentile between 1 and 99.
+
+        Returns:
+            float: The interpolated percentile.
+        """
+        n = len(sorted_data)
+        m = n + 1
+        j = min(max(p * m // 100, 1), n - 1)
+        delta = p * m - j * 100
+        return (sorted_data[j - 1] * (100 - delta) + sorted_data[j] * delta) / 100
 
     def _detailed_stats(self, data: List[float]) -> dict:
         """
@@ -148,28 +491,36 @@ for i in range(iterations):
         Returns:
             dict: Statistics including mean, stdev, percentiles, min, max, count.
         """
-        percentiles = statistics.quantiles(data, n=100) if len(data) >= 20 else [None]*99
+        mean, stdev = self._mean_stdev(data)
+        ordered = sorted(data)
+        n = len(ordered)
+        half = n // 2
+        median = ordered[half] if n % 2 else (ordered[half - 1] + ordered[half]) / 2
+        enough = n >= 20
         return {
-            "mean": statistics.mean(data),
-            "stdev": statistics.stdev(data) if len(data) > 1 else 0,
-            "median": statistics.median(data),
-            "percentile_5": percentiles[4] if percentiles[4] else None,
-            "percentile_95": percentiles[94] if percentiles[94] else None,
-            "min": min(data),
-            "max": max(data),
-            "count": len(data)
+            "mean": mean,
+            "stdev": stdev,
+            "median": median,
+            "percentile_5": self._percentile(ordered, 5) if enough else None,
+            "percentile_95": self._percentile(ordered, 95) if enough else None,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "count": n
         }
 
     def _system_load_info(self) -> dict:
         """
-        Get current system load information.
+        Get system load information.
+
+        CPU usage is averaged since the previous call (made in __init__), so it
+        covers the whole comparison without blocking.
 
         Returns:
             dict: CPU and memory usage info.
         """
         if psutil:
             return {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
+                "cpu_percent": psutil.cpu_percent(interval=None),
                 "virtual_memory": dict(psutil.virtual_memory()._asdict())
             }
         return {"cpu_percent": None, "virtual_memory": None}
@@ -187,34 +538,33 @@ for i in range(iterations):
             "executable": sys.executable
         }
 
-    def _confidence_interval(self, data: List[float], confidence: float = 0.95) -> Tuple[float, float]:
+    def _confidence_interval(self, n: int, mean: float, stdev: float, confidence: float = 0.95) -> Tuple[float, float]:
         """
-        Calculate a confidence interval for the mean of the data.
+        Calculate a confidence interval for the mean from precomputed statistics.
 
         Args:
-            data (List[float]): List of timing measurements.
-            confidence (float): Confidence level (default 0.95).
+            n (int): Number of measurements.
+            mean (float): Mean of the measurements.
+            stdev (float): Sample standard deviation of the measurements.
+            confidence (float): Confidence level (default 0.95; only 95% is tabulated).
 
         Returns:
             (float, float): Lower and upper bounds of the confidence interval.
         """
-        if not data or len(data) < 2:
+        if n < 2:
             return (0.0, 0.0)
-        mean = statistics.mean(data)
-        stdev = statistics.stdev(data)
-        n = len(data)
-        t = 1.96 if n > 30 else {
-            2: 12.71, 3: 4.30, 4: 3.18, 5: 2.78, 6: 2.57, 7: 2.45, 8: 2.36, 9: 2.31, 10: 2.26
-        }.get(n, 2.0)
+        t = _T95[bisect_right(_T95, (n, math.inf)) - 1][1]
         margin = t * stdev / math.sqrt(n)
         return (mean - margin, mean + margin)
 
-    def _reset_state(self):
+    def _make_ns(self) -> dict:
         """
-        Reset any internal state or cache between repetitions.
-        (Currently a placeholder for future use.)
+        Create an empty globals namespace for generated code.
+
+        Returns:
+            dict: Namespace holding only the builtins.
         """
-        pass
+        return {'__builtins__': __builtins__}
 
     def _format_duration(self, seconds: float) -> str:
         """
@@ -249,62 +599,106 @@ for i in range(iterations):
         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"compare_log_{now}.json"
 
-    def _time_single_snippet(
+    def _serialize_json(self, data: dict) -> bytes:
+        """
+        Serialize export data to indented JSON, using orjson when available.
+
+        Args:
+            data (dict): Data to serialize.
+
+        Returns:
+            bytes: UTF-8 encoded JSON document.
+        """
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _seed_random(self, seed: int):
+        """
+        Seed the random module and, once a snippet has been jitted, numba's generator.
+
+        Args:
+            seed (int): Seed to apply.
+        """
+        random.seed(seed)
+        if self._numba_seed is not None:
+            self._numba_seed(seed)
+
+    def _time_one_rep(self, inner: Callable, number: int, seed: int) -> float:
+        """
+        Time one repetition of a snippet; inner() runs the setup before its clock starts.
+
+        Args:
+            inner (callable): Timing function wrapping the setup and the snippet.
+            number (int): Number of executions in the repetition.
+            seed (int): Seed applied to the random generators before the setup runs.
+
+        Returns:
+            float: Time per execution in seconds.
+        """
+        self._seed_random(seed)
+        elapsed_ns = inner(itertools.repeat(None, number), time.perf_counter_ns)
+        return elapsed_ns / number * 1e-9 if number > 0 else 0
+
+    def _time_snippets(
         self,
-        snippet_name: str,
-        code_to_time: str,
-        setup_code: str,
         repeat: int,
         number: int,
         warmup_runs: int = 5,
-        on_repeat_end: Optional[Callable[[int, float], None]] = None
-    ) -> Tuple[float, float]:
+        on_repeat_end: Optional[Callable[[int, float], None]] = None,
+        jit: str = "none"
+    ) -> bool:
         """
-        Time the execution of a single code snippet.
+        Time both code snippets with their repetitions interleaved.
+
+        Each repetition times Snippet 1 and then Snippet 2 with the same seed, so
+        slow drift in CPU frequency or background load affects both equally.
 
         Args:
-            snippet_name (str): Name for reporting.
-            code_to_time (str): The code to time.
-            setup_code (str): Setup code to run before timing.
             repeat (int): Number of repetitions.
             number (int): Number of executions per repetition.
             warmup_runs (int): Warmup runs before timing.
-            on_repeat_end (callable): Optional callback after each repetition.
+            on_repeat_end (callable): Optional callback after each repetition,
+                called with the repetition index and the combined time of both snippets.
+            jit (str): "numba" to time numba-compiled snippets when possible, else "none".
 
         Returns:
-            (float, float): Mean and standard deviation of timings.
+            bool: True if timing completed, False if a snippet raised an error.
         """
-        print(f"Timing {Colors.cyan(snippet_name)} ({Colors.yellow(str(repeat))} repetitions)...")
-        times = []
-        self._warmup(code_to_time, setup_code, runs=warmup_runs)
+        print(f"Timing {Colors.cyan('Snippet 1')} and {Colors.cyan('Snippet 2')} interleaved ({Colors.yellow(str(repeat))} repetitions)...")
+        times_1 = array('d', [0.0]) * repeat
+        times_2 = array('d', [0.0]) * repeat
+        snippet_name = "Snippet 1"
         try:
-            with gc_disabled():
+            inner_1, self.jitted_1 = self._make_inner(snippet_name, self.code_1, jit)
+            self._warmup(inner_1, runs=warmup_runs)
+            snippet_name = "Snippet 2"
+            inner_2, self.jitted_2 = self._make_inner(snippet_name, self.code_2, jit)
+            self._warmup(inner_2, runs=warmup_runs)
+            stdout, stderr = sys.stdout, sys.stderr
+            with gc_disabled(), open(os.devnull, 'w') as devnull:
                 for rep in range(repeat):
-                    local_setup = setup_code + f"\nrandom.seed({self.fixed_seed + rep})"
-                    self._reset_state()
-                    start = time.perf_counter()
-                    with suppress_output():
-                        for _ in range(number):
-                            exec(code_to_time, {}, {})
-                    end = time.perf_counter()
-                    elapsed = (end - start) / number if number > 0 else 0
-                    times.append(elapsed)
+                    seed = self.fixed_seed + rep
+                    sys.stdout = sys.stderr = devnull
+                    try:
+                        snippet_name = "Snippet 1"
+                        times_1[rep] = self._time_one_rep(inner_1, number, seed)
+                        snippet_name = "Snippet 2"
+                        times_2[rep] = self._time_one_rep(inner_2, number, seed)
+                    finally:
+                        sys.stdout, sys.stderr = stdout, stderr
                     if on_repeat_end:
-                        on_repeat_end(rep, elapsed)
-            if "1" in snippet_name:
-                self.measurements_1 = times.copy()
-            else:
-                self.measurements_2 = times.copy()
-            mean_time = statistics.mean(times)
-            stdev_time = statistics.stdev(times) if len(times) > 1 else 0
-            return mean_time, stdev_time
+                        on_repeat_end(rep, times_1[rep] + times_2[rep])
+            self.measurements_1 = times_1
+            self.measurements_2 = times_2
+            return True
         except Exception as e:
             print(Colors.red(Colors.bold("\n--- ERROR during timing ---")))
             print(Colors.red(f"An error occurred while executing {snippet_name}:"))
             print(Colors.red(f"Error details: {e}"))
             print(Colors.yellow("Check setup code and snippet syntax/logic."))
             print(Colors.red(Colors.bold("---------------------------\n")))
-            return None, None
+            return False
 
     def compare_execution(
         self,
@@ -312,7 +706,9 @@ for i in range(iterations):
         num_executions_per_rep: int = 3,
         warmup_runs: int = 5,
         on_repeat_end: Optional[Callable[[int, float], None]] = None,
-        export_json: Optional[str] = None
+        export_json: Optional[str] = None,
+        write_log: bool = True,
+        jit: str = "none"
     ):
         """
         Compare the execution of two code snippets and print/report results.
@@ -323,23 +719,29 @@ for i in range(iterations):
             warmup_runs (int): Warmup runs before timing.
             on_repeat_end (callable): Optional progress callback.
             export_json (str|None): Optional path to export JSON results.
+            write_log (bool): Write the verbose log to the outputs directory (default True).
+            jit (str): "numba" to time numba-compiled snippets when possible (default "none").
 
         Returns:
-            dict: Summary of relative performance, total test time, and log path.
+            dict|None: Summary of relative performance, total test time, and log path
+                (None if no log was written), or None if timing failed.
         """
         print(Colors.bold("\n--- Starting Code Comparison ---"))
         print(f"Repetitions: {Colors.yellow(str(num_repetitions))}, Executions per repetition: {Colors.yellow(str(num_executions_per_rep))}")
         print(f"Warm-up runs: {Colors.yellow(str(warmup_runs))}")
         print(f"Random seed fixed for determinism: {Colors.yellow(str(self.fixed_seed))}")
+        if jit == "numba" and numba is None:
+            print(Colors.yellow("numba is not installed. Timing snippets without JIT."))
+            jit = "none"
+        print(f"JIT: {Colors.yellow(jit)}")
 
         total_start = time.perf_counter()
 
-        mean1, stdev1 = self._time_single_snippet(
-            "Snippet 1", self.code_1, self.setup_code, num_repetitions, num_executions_per_rep, warmup_runs, on_repeat_end
-        )
-        mean2, stdev2 = self._time_single_snippet(
-            "Snippet 2", self.code_2, self.setup_code, num_repetitions, num_executions_per_rep, warmup_runs, on_repeat_end
+        completed = self._time_snippets(
+            num_repetitions, num_executions_per_rep, warmup_runs, on_repeat_end, jit
         )
+        if not completed:
+            return None
 
         total_end = time.perf_counter()
         total_duration = total_end - total_start
@@ -347,19 +749,23 @@ for i in range(iterations):
 
         stats1 = self._detailed_stats(self.measurements_1)
         stats2 = self._detailed_stats(self.measurements_2)
-        ci1 = self._confidence_interval(self.measurements_1)
-        ci2 = self._confidence_interval(self.measurements_2)
-
-        if stats1["mean"] < stats2["mean"]:
+        ci1 = self._confidence_interval(stats1["count"], stats1["mean"], stats1["stdev"])
+        ci2 = self._confidence_interval(stats2["count"], stats2["mean"], stats2["stdev"])
+
+        # Rank by the best (minimum) timing: scheduling noise only ever adds time,
+        # so the minimum is the most stable estimate of a snippet's cost.
+        best1 = stats1["min"]
+        best2 = stats2["min"]
+        if best1 < best2:
             faster = "Snippet 1"
             slower = "Snippet 2"
-            ratio = stats2["mean"] / stats1["mean"] if stats1["mean"] > 0 else float('inf')
-            percent = (1 - stats1["mean"] / stats2["mean"]) * 100 if stats2["mean"] > 0 else 0
+            ratio = best2 / best1 if best1 > 0 else float('inf')
+            percent = (1 - best1 / best2) * 100 if best2 > 0 else 0
         else:
             faster = "Snippet 2"
             slower = "Snippet 1"
-            ratio = stats1["mean"] / stats2["mean"] if stats2["mean"] > 0 else float('inf')
-            percent = (1 - stats2["mean"] / stats1["mean"]) * 100 if stats1["mean"] > 0 else 0
+            ratio = best1 / best2 if best2 > 0 else float('inf')
+            percent = (1 - best2 / best1) * 100 if best1 > 0 else 0
 
         if ratio == float('inf'):
             rel_msg = Colors.red("Relative speed: Not computable (division by zero).")
@@ -370,63 +776,87 @@ for i in range(iterations):
                 f"({Colors.green(f'{percent:.2f}%')} faster)."
             )
             rel_perf = {"times": f"{ratio:.2f}", "percentage": f"{percent:.2f}", "faster": faster, "slower": slower}
+        # With --jit, a snippet numba cannot compile is timed interpreted; a ranking
+        # across the two modes measures the JIT as much as the code.
+        mixed_jit = self.jitted_1 != self.jitted_2
+        rel_perf["mixed_jit"] = mixed_jit
+        mode_1 = "numba" if self.jitted_1 else "interpreted"
+        mode_2 = "numba" if self.jitted_2 else "interpreted"
+        label_1 = f"Snippet 1 [{mode_1}]" if jit != "none" else "Snippet 1"
+        label_2 = f"Snippet 2 [{mode_2}]" if jit != "none" else "Snippet 2"
 
         print(Colors.bold("\n--- Results ---"))
-        print(f"{Colors.cyan('Snippet 1')}: mean = {Colors.green(f'{stats1['mean']*1e6:.2f} μs')}, stdev = {Colors.yellow(f'{stats1['stdev']*1e6:.2f} μs')}, median = {Colors.green(f'{stats1['median']*1e6:.2f} μs')}")
-        print(f"    95% CI: {Colors.yellow(f'{ci1[0]*1e6:.2f} μs')} - {Colors.yellow(f'{ci1[1]*1e6:.2f} μs')}")
-        print(f"{Colors.cyan('Snippet 2')}: mean = {Colors.green(f'{stats2['mean']*1e6:.2f} μs')}, stdev = {Colors.yellow(f'{stats2['stdev']*1e6:.2f} μs')}, median = {Colors.green(f'{stats2['median']*1e6:.2f} μs')}")
-        print(f"    95% CI: {Colors.yellow(f'{ci2[0]*1e6:.2f} μs')} - {Colors.yellow(f'{ci2[1]*1e6:.2f} μs')}")
+        print(f"{Colors.cyan(label_1)}: mean = {Colors.green(f'{stats1['mean']*1e6:.2f} μs')}, stdev = {Colors.yellow(f'{stats1['stdev']*1e6:.2f} μs')}, median = {Colors.green(f'{stats1['median']*1e6:.2f} μs')}")
+        print(f"    95% CI: {Colors.yellow(f'{ci1[0]*1e6:.2f} μs')} - {Colors.yellow(f'{ci1[1]*1e6:.2f} μs')}, best = {Colors.green(f'{best1*1e6:.2f} μs')}")
+        print(f"{Colors.cyan(label_2)}: mean = {Colors.green(f'{stats2['mean']*1e6:.2f} μs')}, stdev = {Colors.yellow(f'{stats2['stdev']*1e6:.2f} μs')}, median = {Colors.green(f'{stats2['median']*1e6:.2f} μs')}")
+        print(f"    95% CI: {Colors.yellow(f'{ci2[0]*1e6:.2f} μs')} - {Colors.yellow(f'{ci2[1]*1e6:.2f} μs')}, best = {Colors.green(f'{best2*1e6:.2f} μs')}")
         print(f"\n{Colors.bold('All individual measurements are logged for further analysis.')}")
         print(f"\n{Colors.bold('Recommendation:')} Run with higher repetitions for more stable results.")
         print(f"\n{rel_msg}")
+        if mixed_jit:
+            print(Colors.yellow(
+                f"Warning: Snippet 1 ran {mode_1} and Snippet 2 ran {mode_2}; "
+                "the ranking compares different execution modes."
+            ))
+        print(Colors.gray("(Ranking compares the best timing of each snippet.)"))
         print(Colors.bold(f"\nTotal test time: {Colors.blue(formatted_total_time)}"))
 
-        outputs_dir = self._ensure_outputs_dir()
-        log_filename = self._get_log_filename()
-        log_path = os.path.join(outputs_dir, log_filename)
-
-        export_data = {
-            "snippet_1": {
-                "source": self.source_1,
-                "code": self.code_1,
-                "stats": stats1,
-                "confidence_interval": ci1,
-                "measurements": self.measurements_1
-            },
-            "snippet_2": {
-                "source": self.source_2,
-                "code": self.code_2,
-                "stats": stats2,
-                "confidence_interval": ci2,
-                "measurements": self.measurements_2
-            },
-            "relative_performance": {
-                "faster": faster,
-                "slower": slower,
-                "ratio": ratio,
-                "percent_faster": percent
-            },
-            "env_info": self._env_info(),
-            "system_load": self._system_load_info(),
-            "parameters": {
-                "num_repetitions": num_repetitions,
-                "num_executions_per_rep": num_executions_per_rep,
-                "warmup_runs": warmup_runs,
-                "fixed_seed": self.fixed_seed
-            },
-            "total_test_time_seconds": total_duration,
-            "total_test_time_human": formatted_total_time
-        }
+        log_rel_path = None
+        if write_log or export_json:
+            export_data = {
+                "snippet_1": {
+                    "source": self.source_1,
+                    "code": self.code_1,
+                    "stats": stats1,
+                    "confidence_interval": ci1,
+                    "jitted": self.jitted_1,
+                    "measurements": self.measurements_1.tolist()
+                },
+                "snippet_2": {
+                    "source": self.source_2,
+                    "code": self.code_2,
+                    "stats": stats2,
+                    "confidence_interval": ci2,
+                    "jitted": self.jitted_2,
+                    "measurements": self.measurements_2.tolist()
+                },
+                "relative_performance": {
+                    "faster": faster,
+                    "slower": slower,
+                    # inf has no JSON form (orjson writes null, json writes Infinity): store null.
+                    "ratio": ratio if math.isfinite(ratio) else None,
+                    "percent_faster": percent if math.isfinite(percent) else None,
+                    "ranked_by": "min",
+                    "mixed_jit": mixed_jit
+                },
+                "env_info": self._env,
+                "system_load": self._system_load_info(),
+                "parameters": {
+                    "num_repetitions": num_repetitions,
+                    "num_executions_per_rep": num_executions_per_rep,
+                    "warmup_runs": warmup_runs,
+                    "fixed_seed": self.fixed_seed,
+                    "jit": jit
+                },
+                "total_test_time_seconds": total_duration,
+                "total_test_time_human": formatted_total_time
+            }
+
+            outputs_dir = self._ensure_outputs_dir()
+            payload = self._serialize_json(export_data)
 
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2)
-        print(Colors.green(f"\nVerbose log written to outputs/{log_filename}"))
+            if write_log:
+                log_filename = self._get_log_filename()
+                log_rel_path = f"outputs/{log_filename}"
+                with open(os.path.join(outputs_dir, log_filename), "wb") as f:
+                    f.write(payload)
+                print(Colors.green(f"\nVerbose log written to {log_rel_path}"))
 
-        if export_json:
-            filename = export_json if os.path.isabs(export_json) else os.path.join(outputs_dir, export_json)
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2)
-            print(Colors.green(f"\nExported detailed results to {filename}"))
+            if export_json:
+                filename = export_json if os.path.isabs(export_json) else os.path.join(outputs_dir, export_json)
+                with open(filename, "wb") as f:
+                    f.write(payload)
+                print(Colors.green(f"\nExported detailed results to {filename}"))
 
         print(Colors.bold("\n--- Comparison Complete ---"))
         print(
@@ -439,5 +869,5 @@ for i in range(iterations):
         return {
             "relative_performance": rel_perf,
             "total_test_time": formatted_total_time,
-            "log_path": f"outputs/{log_filename}"
+            "log_path": log_rel_path
         }
@@ -17,6 +17,10 @@ def suppress_output():
 
 @contextmanager
 def gc_disabled():
+    # Collect first so pending garbage (e.g. from warmup) is not collected
+    # mid-measurement; the second pass catches objects freed by finalizers.
+    gc.collect()
+    gc.collect()
     gc_enabled = gc.isenabled()
     gc.disable()
     try: